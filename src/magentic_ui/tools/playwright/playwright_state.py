@@ -1,5 +1,7 @@
-from typing import Dict, List, Any
+import asyncio
+from typing import Dict, List, Any, Tuple
 from playwright.async_api import BrowserContext, Page, StorageState
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import BaseModel
 from logging import getLogger
 
@@ -28,10 +30,32 @@ class BrowserState(BaseModel):
     activeTabIndex: int
 
 
+async def _get_scroll_position(page: Page) -> Tuple[int, int]:
+    """
+    Read the scroll position of a page in a single evaluate call.
+
+    Args:
+        page (Page): The page to read the scroll position of
+
+    Returns:
+        Tuple[int, int]: The x and y scroll position, or (0, 0) if it can't be read.
+    """
+    try:
+        scroll: Dict[str, int] = await page.evaluate(
+            "() => ({ scrollX: window.scrollX, scrollY: window.scrollY })"
+        )
+        # Cast values to int to avoid float issues
+        return int(scroll["scrollX"]), int(scroll["scrollY"])
+    except Exception:
+        # In case evaluation fails, use default scroll positions
+        return 0, 0
+
+
 async def save_browser_state(
     context: BrowserContext,
     controlled_page: Page | None = None,
     simplified: bool = True,
+    storage_path: str | None = None,
 ) -> BrowserState:
     """
     Save the browser's storage state along with the URLs and scroll positions of all open tabs,
@@ -41,38 +65,38 @@ async def save_browser_state(
         context (BrowserContext): The browser context to save state from
         controlled_page (Page, optional): Optional page that is currently being controlled
         simplified (bool, optional): If True, skip saving scroll positions and storage state. Saving context state can interfere with the live browser. Default: True
+        storage_path (str, optional): If provided (and simplified is False), the storage state is written directly to this file by Playwright and the returned state only holds a reference to it (`{"path": storage_path}`) instead of the full storage dict. Default: None
 
     Returns:
         BrowserState: A BrowserState instance.
     """
 
+    state: StorageState | Dict[str, str]
+    if simplified:
+        state = StorageState(origins=[])
+    elif storage_path is not None:
+        # Let Playwright write the storage state straight to disk so we never hold
+        # the full cookies + localStorage dict in memory
+        await context.storage_state(path=storage_path)
+        state = {"path": storage_path}
+    else:
+        state = await context.storage_state()
+
+    pages = context.pages
     # Use controlled page as active tab if provided, otherwise use first page
-    active_tab_index = 0
-    if controlled_page is not None:
-        # Find index of controlled page
-        for i, page in enumerate(context.pages):
-            if page == controlled_page:
-                active_tab_index = i
-                break
-
-    state: StorageState = (
-        await context.storage_state() if not simplified else StorageState(origins=[])
-    )
+    active_tab_index = pages.index(controlled_page) if controlled_page in pages else 0
+
+    scroll_positions: List[Tuple[int, int]]
+    if simplified:
+        scroll_positions = [(0, 0)] * len(pages)
+    else:
+        # Tabs are independent, so their scroll positions are read concurrently
+        scroll_positions = await asyncio.gather(
+            *(_get_scroll_position(page) for page in pages)
+        )
 
     open_tabs: List[Tab] = []
-    for i, page in enumerate(context.pages):
-        if simplified:
-            sx, sy = 0, 0
-        else:
-            try:
-                scroll: Dict[str, int] = await page.evaluate(
-                    "() => ({ scrollX: window.scrollX, scrollY: window.scrollY })"
-                )
-                # Cast values to int to avoid float issues
-                sx, sy = int(scroll["scrollX"]), int(scroll["scrollY"])
-            except Exception:
-                # In case evaluation fails, use default scroll positions
-                sx, sy = 0, 0
+    for i, (page, (sx, sy)) in enumerate(zip(pages, scroll_positions)):
         assert isinstance(page.url, str)
         open_tabs.append(
             Tab(
@@ -86,6 +110,25 @@ async def save_browser_state(
     return BrowserState(state=state, tabs=open_tabs, activeTabIndex=active_tab_index)
 
 
+async def _restore_tab(page: Page, tab: Tab) -> None:
+    """
+    Navigate a new page to a saved tab's URL and scroll position. If the tab can't be
+    restored, the page is left as it is (about:blank) so the other tabs still load.
+
+    Args:
+        page (Page): The page to restore the tab into
+        tab (Tab): The saved tab
+    """
+    try:
+        # goto already waits for the load event
+        await page.goto(tab.url)
+        await page.evaluate(
+            "([x, y]) => window.scrollTo(x, y)", [tab.scrollX, tab.scrollY]
+        )
+    except Exception as e:
+        logger.error(f"Error restoring tab {tab.url}: {e}")
+
+
 async def load_browser_state(
     context: BrowserContext, state: BrowserState, load_only_active_tab: bool = False
 ) -> None:
@@ -108,24 +151,17 @@ async def load_browser_state(
             if page.url == "about:blank":
                 await page.close()
 
-        restored_tabs: List[str] = []
-        pages: List[Page] = []
-
         # Determine which tabs to restore
         tabs_to_restore = (
             [state.tabs[state.activeTabIndex]] if load_only_active_tab else state.tabs
         )
 
-        # Create tabs
-        for tab in tabs_to_restore:
-            page: Page = await context.new_page()
-            await page.goto(tab.url)
-            await page.wait_for_load_state("load")
-            await page.evaluate(
-                "([x, y]) => window.scrollTo(x, y)", [tab.scrollX, tab.scrollY]
-            )
-            restored_tabs.append(f"{tab.url} ({tab.scrollX}, {tab.scrollY})")
-            pages.append(page)
+        # Create the tabs one by one so they keep their saved order, then load them
+        # concurrently since they don't depend on each other
+        pages: List[Page] = [await context.new_page() for _ in tabs_to_restore]
+        await asyncio.gather(
+            *(_restore_tab(page, tab) for page, tab in zip(pages, tabs_to_restore))
+        )
 
         # Bring the active tab to front
         if pages:
@@ -134,7 +170,12 @@ async def load_browser_state(
             active_index = 0 if load_only_active_tab else state.activeTabIndex
             if 0 <= active_index < len(pages):
                 await pages[active_index].bring_to_front()
-            await pages[0].wait_for_timeout(5000)
+            # Give the active tab up to 5 seconds to settle, but move on as soon as it is idle
+            target = pages[active_index] if 0 <= active_index < len(pages) else pages[0]
+            try:
+                await target.wait_for_load_state("networkidle", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
 
     except Exception as e:
         logger.error(f"Error loading state: {e}")
@@ -1,4 +1,5 @@
-from typing import Tuple
+from typing import Set, Tuple
+from weakref import WeakKeyDictionary
 from playwright.async_api import Page
 import asyncio
 
@@ -10,6 +11,8 @@ class AnimationUtilsPlaywright:
 
     def __init__(self) -> None:
         self.last_cursor_position: Tuple[float, float] = (0.0, 0.0)
+        # Identifiers of elements that may currently carry a highlight, per page
+        self._highlighted: WeakKeyDictionary[Page, Set[str]] = WeakKeyDictionary()
 
     async def add_cursor_box(self, page: Page, identifier: str) -> None:
         """
@@ -19,6 +22,7 @@ class AnimationUtilsPlaywright:
             page (Page): The Playwright page object.
             identifier (str): The element identifier.
         """
+        self._highlighted.setdefault(page, set()).add(identifier)
         try:
             # 1. Highlight the element (if it exists)
             await page.evaluate(
@@ -85,41 +89,40 @@ class AnimationUtilsPlaywright:
             steps (int, optional): Number of small steps for the movement. Default: 20
             step_delay (float, optional): Delay (in seconds) between steps. Default: 0.05
         """
-        # Ensure the cursor is on the page
+        # Precompute the whole trajectory (including the final position) once, then
+        # hand it to the page in a single call that paces the movement itself.
+        # Timers in hidden tabs are throttled to about one per second, so the page
+        # jumps to the final position once the expected duration has passed. This
+        # also bounds how long the animation keeps running if the caller is cancelled.
+        points = [
+            [
+                start_x + (end_x - start_x) * (step / steps),
+                start_y + (end_y - start_y) * (step / steps),
+            ]
+            for step in range(steps)
+        ]
+        points.append([end_x, end_y])
         try:
-            for step in range(steps):
-                # Linear interpolation
-                x = start_x + (end_x - start_x) * (step / steps)
-                y = start_y + (end_y - start_y) * (step / steps)
-
-                # Move the cursor via JS
-                await page.evaluate(
-                    """
-                    ([x, y]) => {
+            await page.evaluate(
+                """
+                async ([points, delay]) => {
+                    const deadline = Date.now() + delay * (points.length - 1);
+                    for (let i = 0; i < points.length; i++) {
+                        if (Date.now() >= deadline) {
+                            i = points.length - 1;
+                        }
                         const cursor = document.getElementById('red-cursor');
                         if (cursor) {
-                            cursor.style.left = x + 'px';
-                            cursor.style.top = y + 'px';
+                            cursor.style.left = points[i][0] + 'px';
+                            cursor.style.top = points[i][1] + 'px';
+                        }
+                        if (i < points.length - 1) {
+                            await new Promise((resolve) => setTimeout(resolve, delay));
                         }
-                    }
-                    """,
-                    [x, y],
-                )
-
-                await asyncio.sleep(step_delay)
-
-            # Final position
-            await page.evaluate(
-                """
-                ([x, y]) => {
-                    const cursor = document.getElementById('red-cursor');
-                    if (cursor) {
-                        cursor.style.left = x + 'px';
-                        cursor.style.top = y + 'px';
                     }
                 }
                 """,
-                [end_x, end_y],
+                [points, step_delay * 1000],
             )
         except Exception:
             pass
@@ -152,6 +155,7 @@ class AnimationUtilsPlaywright:
                 """,
                 identifier,
             )
+            self._highlighted.get(page, set()).discard(identifier)
         except Exception:
             pass
 
@@ -164,17 +168,27 @@ class AnimationUtilsPlaywright:
             page (Page): The Playwright page object.
         """
         try:
-            # Remove cursor and highlights using the same approach as in remove_cursor_box
+            # Remove cursor and highlights using the same approach as in remove_cursor_box.
+            # Only the elements we highlighted are visited; the full scan over every
+            # tagged element is kept as a fallback for when nothing was tracked.
             await page.evaluate(
                 """
-                () => {
+                (identifiers) => {
                     // Remove cursor
                     const cursor = document.getElementById('red-cursor');
                     if (cursor) {
                         cursor.remove();
                     }
-                    // Remove highlights from all elements
-                    const elements = document.querySelectorAll('[__elementId]');
+                    let elements = [];
+                    if (identifiers.length > 0) {
+                        const selector = identifiers
+                            .map((id) => `[__elementId="${CSS.escape(id)}"]`)
+                            .join(',');
+                        elements = document.querySelectorAll(selector);
+                    } else {
+                        elements = document.querySelectorAll('[__elementId]');
+                    }
+                    // Remove highlights
                     elements.forEach(el => {
                         if (el.style.border && el.style.transition) {
                             el.style.border = '';
@@ -182,8 +196,10 @@ class AnimationUtilsPlaywright:
                         }
                     });
                 }
-                """
+                """,
+                list(self._highlighted.get(page, ())),
             )
+            self._highlighted.pop(page, None)
             # Reset the last cursor position
             self.last_cursor_position = (0.0, 0.0)
         except Exception:
@@ -37,13 +37,16 @@ class WebpageTextUtilsPlaywright:
             str: The text content of the page.
         """
         try:
-            text_in_viewport = await page.evaluate("""() => {
-                return document.body.innerText;
-            }""")
-            text_in_viewport = "\n".join(text_in_viewport.split("\n")[:n_lines])
-            # remove empty lines
-            text_in_viewport = "\n".join(
-                [line for line in text_in_viewport.split("\n") if line.strip()]
+            # Truncate to the first n_lines and remove empty lines in the page so only
+            # the text we keep is sent back over the wire
+            text_in_viewport = await page.evaluate(
+                """(n_lines) => {
+                return document.body.innerText
+                    .split('\\n', n_lines)
+                    .filter((line) => line.trim())
+                    .join('\\n');
+            }""",
+                n_lines,
             )
             assert isinstance(text_in_viewport, str)
             return text_in_viewport
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, cast
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, cast
 from typing_extensions import TypedDict
 from ..approval_guard import MaybeRequiresApproval
 from autogen_core.tools import ToolSchema, ParametersSchema
@@ -10,12 +11,39 @@ class ToolMetadata(TypedDict):
     irreversible: MaybeRequiresApproval
 
 
-_tool_metadata: dict[str, ToolMetadata] = {}
+class _ToolMetadataRegistry:
+    """
+    Registry of tool metadata keyed by tool name.
+
+    Tools are registered rarely (usually at import time) and looked up on every tool call.
+    Registration is copy-on-write: it builds a new read-only mapping and swaps it in, so
+    lookups read a mapping that is never mutated and never copied.
+    """
+
+    def __init__(self) -> None:
+        self._metadata: Mapping[str, ToolMetadata] = MappingProxyType({})
+
+    def register(self, name: str, metadata: ToolMetadata) -> None:
+        """Register (or replace) the metadata for a tool."""
+        self._metadata = MappingProxyType({**self._metadata, name: metadata})
+
+    def get(self, name: str | None) -> ToolMetadata | None:
+        """Get the metadata for a tool, or None if it was never registered."""
+        if name is None:
+            return None
+        return self._metadata.get(name)
+
+    def snapshot(self) -> Mapping[str, ToolMetadata]:
+        """Return a read-only view of the tool metadata registered so far."""
+        return self._metadata
+
+
+_tool_metadata = _ToolMetadataRegistry()
 
 
 def load_tool(tooldef: Dict[str, Any]) -> ToolSchema:
     tool_metadata: ToolMetadata = cast(ToolMetadata, tooldef.get("metadata", {}))
-    _tool_metadata[tooldef["function"]["name"]] = tool_metadata
+    _tool_metadata.register(tooldef["function"]["name"], tool_metadata)
 
     return ToolSchema(
         name=tooldef["function"]["name"],
@@ -1,4 +1,6 @@
-from typing import Dict, List, Literal
+import functools
+from collections import OrderedDict
+from typing import Dict, List, Literal, NamedTuple, Tuple
 import tldextract
 from urllib.parse import urlparse
 
@@ -7,6 +9,56 @@ URL_REJECTED: Literal["rejected"] = "rejected"
 
 UrlStatus = Literal["allowed", "rejected"]
 
+# Schemes that are treated as the same when matching urls
+_HTTP_EQUIVALENT_SCHEMES = frozenset(("http", "https"))
+
+# Maximum number of urls whose classification is remembered by a UrlStatusManager
+_CLASSIFICATION_CACHE_SIZE = 8192
+
+
+class _UrlClassification(NamedTuple):
+    """Which of the block list, allowed patterns and rejected patterns a URL matches."""
+
+    blocked: bool
+    allowed: bool
+    rejected: bool
+
+
+class _ParsedUrl(NamedTuple):
+    """The components of a URL that take part in matching."""
+
+    scheme: str
+    subdomain: str
+    domain: str
+    suffix: str
+    path: str
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_url(url: str) -> _ParsedUrl:
+    """
+    Splits a URL into the components used for matching. Results are cached since the
+    same urls are checked again and again while browsing.
+
+    Args:
+        url (str): The URL to parse. If no scheme is provided, http is assumed.
+
+    Returns:
+        _ParsedUrl: The parsed URL components.
+    """
+    parsed_url = urlparse(url)
+    if not parsed_url.scheme:
+        url = "http://" + url
+        parsed_url = urlparse(url)
+    extracted_url = tldextract.extract(url)
+    return _ParsedUrl(
+        scheme=parsed_url.scheme,
+        subdomain=extracted_url.subdomain,
+        domain=extracted_url.domain,
+        suffix=extracted_url.suffix,
+        path=parsed_url.path,
+    )
+
 
 class UrlStatusManager:
     """
@@ -37,13 +89,38 @@ class UrlStatusManager:
             url_block_list (List[str], optional): initial url block list. Default: None.
         """
         self.url_statuses = None
+        # Parsed status patterns grouped by domain. A pattern can only match urls with
+        # the same domain, so only that group has to be checked for a url
+        self._status_patterns: Dict[str, Dict[str, Tuple[_ParsedUrl, UrlStatus]]] = {}
+        # Recent classifications, cleared whenever a status changes
+        self._classification_cache: OrderedDict[str, _UrlClassification] = OrderedDict()
         # a little bit of a hack to make sure there are no trailing slashes, since they mess with the comparison later on
         if url_statuses is not None:
             self.url_statuses = {
                 key.rstrip("/"): value for key, value in url_statuses.items()
             }
+            for site, status in self.url_statuses.items():
+                self._add_status_pattern(site, status)
 
         self.url_block_list = url_block_list
+        # The block list is fixed after construction, so it is parsed once here
+        self._blocked_patterns: Tuple[_ParsedUrl, ...] = tuple(
+            _parse_url(site) for site in url_block_list or ()
+        )
+
+    def _add_status_pattern(self, site: str, status: UrlStatus) -> None:
+        """
+        Parses a status pattern and stores it under its domain, replacing any earlier status for the same site.
+
+        Args:
+            site (str): The website pattern, without trailing slashes.
+            status (UrlStatus): The status of the pattern.
+        """
+        parsed_site = _parse_url(site)
+        self._status_patterns.setdefault(parsed_site.domain, {})[site] = (
+            parsed_site,
+            status,
+        )
 
     def set_url_status(self, url: str, status: UrlStatus) -> None:
         """
@@ -58,57 +135,118 @@ class UrlStatusManager:
             # Trailing slash messes up the comparison later on
             url = url.rstrip("/")
             self.url_statuses[url] = status
+            self._add_status_pattern(url, status)
+            self._classification_cache.clear()
 
-    def _is_url_match(self, registered_url: str, proposed_url: str) -> bool:
+    def _is_url_match(
+        self, registered_url: _ParsedUrl, proposed_url: _ParsedUrl
+    ) -> bool:
         """
         Checks if a proposed URL matches a registered URL pattern.
 
         Args:
-            registered_url (str): The registered URL pattern to match against.
-            proposed_url (str): The proposed URL to check.
+            registered_url (_ParsedUrl): The registered URL pattern to match against.
+            proposed_url (_ParsedUrl): The proposed URL to check.
 
         Returns:
             bool: True if the proposed URL matches the registered URL pattern, False otherwise.
         """
-        # If no scheme is provided, assume http
-        if not urlparse(registered_url).scheme:
-            registered_url = "http://" + registered_url
-        if not urlparse(proposed_url).scheme:
-            proposed_url = "http://" + proposed_url
-
-        parsed_registered_url = urlparse(registered_url)
-        parsed_proposed_url = urlparse(proposed_url)
-        extracted_registered_url = tldextract.extract(registered_url)
-        extracted_proposed_url = tldextract.extract(proposed_url)
-
         # if both urls have a scheme, check if they are the same (http and https are treated as the same)
-        http_equivalent_schemes = ["http", "https"]
         if (
-            parsed_registered_url.scheme in http_equivalent_schemes
-            and parsed_proposed_url.scheme in http_equivalent_schemes
+            registered_url.scheme in _HTTP_EQUIVALENT_SCHEMES
+            and proposed_url.scheme in _HTTP_EQUIVALENT_SCHEMES
         ):
             pass
-        elif parsed_registered_url.scheme != parsed_proposed_url.scheme:
+        elif registered_url.scheme != proposed_url.scheme:
             return False
 
         # Check each component of the URL
         # TODO: what to do about params, query, and fragment components?
-        if extracted_registered_url.subdomain:
-            if extracted_registered_url.subdomain != extracted_proposed_url.subdomain:
+        if registered_url.subdomain:
+            if registered_url.subdomain != proposed_url.subdomain:
                 return False
-        if extracted_registered_url.domain != extracted_proposed_url.domain:
+        if registered_url.domain != proposed_url.domain:
             return False
-        if (
-            extracted_registered_url.suffix
-            and extracted_proposed_url.suffix != extracted_registered_url.suffix
-        ):
+        if registered_url.suffix and proposed_url.suffix != registered_url.suffix:
             return False
-        if parsed_registered_url.path:
-            if not parsed_proposed_url.path.startswith(parsed_registered_url.path):
+        if registered_url.path:
+            if not proposed_url.path.startswith(registered_url.path):
                 return False
 
         return True
 
+    def _is_parsed_url_blocked(self, proposed_url: _ParsedUrl) -> bool:
+        """
+        Checks an already parsed URL against the block list.
+
+        Args:
+            proposed_url (_ParsedUrl): The parsed URL to check.
+
+        Returns:
+            bool: True if the url is blocked, False otherwise.
+        """
+        return any(
+            self._is_url_match(blocked_url, proposed_url)
+            for blocked_url in self._blocked_patterns
+        )
+
+    def _classify(self, url: str) -> _UrlClassification:
+        """
+        Checks a url against the block list and the status list, reusing the result of earlier
+        checks of the same url.
+
+        Args:
+            url (str): The website to check.
+
+        Returns:
+            _UrlClassification: Whether the url is blocked, matches an allowed pattern (always True
+            if no status list is defined) and matches a rejected pattern.
+        """
+        classification = self._classification_cache.get(url)
+        if classification is not None:
+            self._classification_cache.move_to_end(url)
+            return classification
+        classification = self._classify_uncached(url)
+        self._classification_cache[url] = classification
+        if len(self._classification_cache) > _CLASSIFICATION_CACHE_SIZE:
+            self._classification_cache.popitem(last=False)
+        return classification
+
+    def _classify_uncached(self, url: str) -> _UrlClassification:
+        """
+        Parses a url once and checks it against the block list and the status list in a single pass.
+
+        Args:
+            url (str): The website to check.
+
+        Returns:
+            _UrlClassification: The classification of the url.
+        """
+        proposed_url = _parse_url(url)
+        if self._is_parsed_url_blocked(proposed_url):
+            return _UrlClassification(blocked=True, allowed=False, rejected=False)
+        if self.url_statuses is None:
+            return _UrlClassification(blocked=False, allowed=True, rejected=False)
+        allowed = False
+        rejected = False
+        candidates = self._status_patterns.get(proposed_url.domain, {})
+        for registered_url, status in candidates.values():
+            # Skip entries whose status has already been matched
+            if status == URL_ALLOWED:
+                if allowed:
+                    continue
+            elif rejected:
+                continue
+            if not self._is_url_match(registered_url, proposed_url):
+                continue
+            if status == URL_ALLOWED:
+                allowed = True
+            else:
+                rejected = True
+            if allowed and rejected:
+                break
+        return _UrlClassification(blocked=False, allowed=allowed, rejected=rejected)
+
     def is_url_blocked(self, url: str) -> bool:
         """
         Checks if a url is explicitly blocked.
@@ -119,11 +257,9 @@ class UrlStatusManager:
         Returns:
             bool: True if the url is blocked, False otherwise.
         """
-        if self.url_block_list is None:
+        if not self._blocked_patterns:
             return False
-        if any(self._is_url_match(site, url) for site in self.url_block_list):
-            return True
-        return False
+        return self._is_parsed_url_blocked(_parse_url(url))
 
     def is_url_rejected(self, url: str) -> bool:
         """
@@ -135,16 +271,8 @@ class UrlStatusManager:
         Returns:
             bool: True if the url was rejected by the user, False otherwise.
         """
-        if self.is_url_blocked(url):
-            return True
-        if self.url_statuses is None:
-            return False
-        if any(
-            self._is_url_match(site, url) and self.url_statuses[site] == URL_REJECTED
-            for site in self.url_statuses
-        ):
-            return True
-        return False
+        classification = self._classify(url)
+        return classification.blocked or classification.rejected
 
     def is_url_allowed(self, url: str) -> bool:
         """
@@ -156,16 +284,8 @@ class UrlStatusManager:
         Returns:
             bool: True if the url is allowed, False otherwise.
         """
-        if self.is_url_blocked(url):
-            return False
-        if self.url_statuses is None:
-            return True
-        if not any(
-            self._is_url_match(site, url) and self.url_statuses[site] == URL_ALLOWED
-            for site in self.url_statuses
-        ):
-            return False
-        return True
+        classification = self._classify(url)
+        return not classification.blocked and classification.allowed
 
     def get_allowed_sites(self) -> List[str] | None:
         """
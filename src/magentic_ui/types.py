@@ -1,12 +1,16 @@
+import functools
 import json
 from typing import Optional, List, Dict, Sequence, Union, Any
 from autogen_agentchat.messages import BaseAgentEvent
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from dataclasses import dataclass
 from pathlib import Path
 
+# One shared decoder, json.loads re-checks its arguments on every call
+_json_decode = json.JSONDecoder().decode
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RunPaths:
     """
     A dataclass that contains the paths to the run directories.
@@ -36,6 +40,8 @@ class PlanStep(BaseModel):
         agent_name (str): The name of the agent responsible for this step.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     details: str
     agent_name: str
@@ -56,6 +62,8 @@ class Plan(BaseModel):
         )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     task: Optional[str]
     steps: Sequence[PlanStep]
 
@@ -67,20 +75,24 @@ class Plan(BaseModel):
 
     def __str__(self) -> str:
         """Return the string representation of the plan."""
-        plan_str = ""
+        parts: List[str] = []
         if self.task is not None:
-            plan_str += f"Task: {self.task}\n"
+            parts.append(f"Task: {self.task}\n")
         for i, step in enumerate(self.steps):
-            plan_str += f"{i}. {step.agent_name}: {step.title}\n   {step.details}\n"
-        return plan_str
+            parts.append(f"{i}. {step.agent_name}: {step.title}\n   {step.details}\n")
+        return "".join(parts)
 
     @classmethod
     def from_list_of_dicts_or_str(
         cls, plan_dict: Union[List[Dict[str, str]], str, List[Any], Dict[str, Any]]
     ) -> Optional["Plan"]:
-        """Load Plan from a list of dictionaries or a JSON string."""
+        """
+        Load Plan from a list of dictionaries or a JSON string. Steps are built without
+        validation, missing fields get defaults and the rest are coerced with str(), so
+        a null title becomes "None" instead of raising.
+        """
         if isinstance(plan_dict, str):
-            plan_dict = json.loads(plan_dict)
+            plan_dict = _json_decode(plan_dict)
         if len(plan_dict) == 0:
             return None
         assert isinstance(plan_dict, (list, dict))
@@ -90,18 +102,21 @@ class Plan(BaseModel):
             task = plan_dict.get("task", None)
             plan_dict = plan_dict.get("steps", [])
 
-        steps: List[PlanStep] = []
-        for raw_step in plan_dict:
-            if isinstance(raw_step, dict):
-                step: dict[str, Any] = raw_step  # type: ignore
-                steps.append(
-                    PlanStep(
-                        title=step.get("title", "Untitled Step"),
-                        details=step.get("details", "No details provided."),
-                        agent_name=step.get("agent_name", "agent"),
-                    )
-                )
-        return cls(task=task, steps=steps) if steps else None
+        # Every field is coerced to its declared type here, so validation can be skipped
+        steps: List[PlanStep] = [
+            PlanStep.model_construct(
+                title=str(step.get("title", "Untitled Step")),  # type: ignore
+                details=str(step.get("details", "No details provided.")),  # type: ignore
+                agent_name=str(step.get("agent_name", "agent")),  # type: ignore
+            )
+            for step in plan_dict
+            if isinstance(step, dict)
+        ]
+        if not steps:
+            return None
+        return cls.model_construct(
+            task=str(task) if task is not None else None, steps=steps
+        )
 
 
 class HumanInputFormat(BaseModel):
@@ -114,34 +129,34 @@ class HumanInputFormat(BaseModel):
         plan (Plan, optional): A plan object.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     content: str
     accepted: bool = False
     plan: Optional[Plan] = None
 
     @classmethod
     def from_str(cls, input_str: str) -> "HumanInputFormat":
-        """Load HumanInputFormat from a string after validation."""
-        try:
-            data = json.loads(input_str)
-            if not isinstance(data, dict):
-                raise ValueError("Input string must be a JSON object")
-        except (json.JSONDecodeError, ValueError):
-            data = {"content": input_str}
-        assert isinstance(data, dict)
-
-        return cls(
-            content=str(data.get("content", "")),  # type: ignore
-            accepted=bool(data.get("accepted", False)),  # type: ignore
-            plan=Plan.from_list_of_dicts_or_str(data.get("plan", [])),  # type: ignore
-        )
+        """
+        Load HumanInputFormat from a string without validation. Fields are coerced to
+        their types, plan step fields with str(). Non-JSON input becomes the content.
+        """
+        return _human_input_from_str(cls, input_str)
 
     @classmethod
     def from_dict(cls, input_dict: Dict[str, Any]) -> "HumanInputFormat":
-        """Load HumanInputFormat from a dictionary after validation."""
-        return cls(
+        """
+        Load HumanInputFormat from a dictionary without validation. Fields are coerced
+        to their types, plan step fields with str().
+        """
+        plan = input_dict.get("plan", None)
+        # Plans are taken as is, raw plans are coerced the same way from_str does
+        if not isinstance(plan, Plan):
+            plan = Plan.from_list_of_dicts_or_str(plan) if plan else None
+        return cls.model_construct(
             content=str(input_dict.get("content", "")),
             accepted=bool(input_dict.get("accepted", False)),
-            plan=input_dict.get("plan", None),  # type: ignore
+            plan=plan,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -150,13 +165,50 @@ class HumanInputFormat(BaseModel):
 
     def to_str(self) -> str:
         """Return the string representation of the input."""
-        return json.dumps(self.model_dump())
+        return json.dumps(
+            {
+                "content": self.content,
+                "accepted": self.accepted,
+                "plan": self.plan.model_dump() if self.plan is not None else None,
+            }
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _human_input_from_str(
+    cls: type[HumanInputFormat], input_str: str
+) -> HumanInputFormat:
+    """
+    Parse a HumanInputFormat from a string. Results are cached since the same user
+    messages are parsed again every time a thread is turned into context.
+    """
+    # Only a JSON object can carry the structured fields, so skip parsing
+    # plain sentences instead of paying for a failed json.loads
+    if not input_str.lstrip().startswith("{"):
+        return cls.model_construct(content=input_str, accepted=False, plan=None)  # type: ignore
+    try:
+        data = _json_decode(input_str)
+        if not isinstance(data, dict):
+            raise ValueError("Input string must be a JSON object")
+    except (json.JSONDecodeError, ValueError):
+        data = {"content": input_str}
+    assert isinstance(data, dict)
+
+    return cls.model_construct(
+        content=str(data.get("content", "")),  # type: ignore
+        accepted=bool(data.get("accepted", False)),  # type: ignore
+        plan=Plan.from_list_of_dicts_or_str(data.get("plan", [])),  # type: ignore
+    )
+
+
+# Shared by every CheckpointEvent, must not be mutated
+_CHECKPOINT_METADATA: Dict[str, str] = {"internal": "yes"}
 
 
 class CheckpointEvent(BaseAgentEvent):
     state: str
     content: str = "Checkpoint"
-    metadata: Dict[str, str] = {"internal": "yes"}
+    metadata: Dict[str, str] = Field(default_factory=lambda: _CHECKPOINT_METADATA)
 
     def to_text(self) -> str:
         return "Checkpoint"
@@ -1,8 +1,9 @@
+import functools
 import json
 import logging
 import os
-import psutil
-from typing import List, Union, Dict
+import socket
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union, Dict, cast
 
 from autogen_core.models import (
     LLMMessage,
@@ -10,7 +11,7 @@ from autogen_core.models import (
     AssistantMessage,
 )
 
-from autogen_agentchat.utils import remove_images
+from autogen_agentchat.utils import content_to_str
 from autogen_agentchat.messages import (
     BaseChatMessage,
     BaseTextChatMessage,
@@ -41,6 +42,11 @@ JsonList = List[Union[JsonPrimitive, "JsonDict", "JsonList"]]
 JsonDict = Dict[str, Union[JsonPrimitive, JsonList, "JsonDict"]]
 JsonData = Union[JsonDict, JsonList, str]
 
+# Marks the end of an iterator in json_data_to_markdown
+_END = object()
+# Indent prefixes used by json_data_to_markdown, so common depths don't allocate a new string per line
+_INDENTS = ["  " * i for i in range(64)]
+
 
 def json_data_to_markdown(data: JsonData) -> str:
     """
@@ -61,37 +67,49 @@ def json_data_to_markdown(data: JsonData) -> str:
         json.JSONDecodeError: If the input string is not valid JSON.
     """
 
-    def format_dict(d: JsonDict, indent: int = 0) -> str:
-        md = ""
-        for key, value in d.items():
-            md += "  " * indent + f"- {key}: "
-            if isinstance(value, dict):
-                md += "\n" + format_dict(value, indent + 1)
-            elif isinstance(value, list):
-                md += "\n" + format_list(value, indent + 1)
+    def to_markdown(root: JsonDict | JsonList) -> str:
+        # Walk the structure with an explicit stack instead of recursion and collect the
+        # fragments in a list, joining them once at the end
+        parts: List[str] = []
+        # Dict frames iterate over (key, value) pairs, list frames over the values
+        stack: List[Tuple[Iterator[Tuple[str, Any]] | Iterator[Any], int, bool]] = [
+            (iter(root.items()), 0, True)
+            if isinstance(root, dict)
+            else (iter(root), 0, False)
+        ]
+        while stack:
+            entries, indent, is_dict = stack[-1]
+            entry: Any = next(entries, _END)
+            if entry is _END:
+                stack.pop()
+                continue
+            prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
+            if is_dict:
+                key, value = entry
+                parts.append(f"{prefix}- {key}: ")
+                if not isinstance(value, (dict, list)):
+                    parts.append(f"{value}\n")
+                    continue
             else:
-                md += f"{value}\n"
-        return md
-
-    def format_list(lst: JsonList, indent: int = 0) -> str:
-        md = ""
-        for item in lst:
-            if isinstance(item, dict):
-                md += "  " * indent + "- \n" + format_dict(item, indent + 1)
-            elif isinstance(item, list):
-                md += "  " * indent + "- \n" + format_list(item, indent + 1)
+                value = entry
+                if not isinstance(value, (dict, list)):
+                    parts.append(f"{prefix}- {value}\n")
+                    continue
+                parts.append(f"{prefix}- ")
+            # Nested containers start on a new line, one level deeper
+            parts.append("\n")
+            if isinstance(value, dict):
+                stack.append((iter(cast(JsonDict, value).items()), indent + 1, True))
             else:
-                md += "  " * indent + f"- {item}\n"
-        return md
+                stack.append((iter(cast(JsonList, value)), indent + 1, False))
+        return "".join(parts)
 
     try:
         if isinstance(data, str):
             data = json.loads(data)
 
-        if isinstance(data, list):
-            return format_list(data)
-        elif isinstance(data, dict):
-            return format_dict(data)
+        if isinstance(data, (list, dict)):
+            return to_markdown(data)
         else:
             raise ValueError(f"Expected dict, list or JSON string, got {type(data)}")
 
@@ -119,6 +137,95 @@ def dict_to_str(data: Union[JsonDict, str]) -> str:
         raise ValueError("Unexpected input type")
 
 
+def _human_input_to_str(input_str: str) -> str:
+    human_input = HumanInputFormat.from_str(input_str)
+    if human_input.plan is None:
+        return human_input.content
+    return f"{human_input.content}\n\nI created the following plan: {human_input.plan}"
+
+
+def _skip_message(
+    m: BaseAgentEvent | BaseChatMessage, agent_name: str, is_multimodal: bool
+) -> LLMMessage | None:
+    # Tool call messages are not part of the context.
+    return None
+
+
+def _stop_or_handoff_to_message(
+    m: BaseAgentEvent | BaseChatMessage, agent_name: str, is_multimodal: bool
+) -> LLMMessage | None:
+    assert isinstance(m, (StopMessage, HandoffMessage)), f"{type(m)}"
+    return UserMessage(content=m.content, source=m.source)
+
+
+def _chat_message_to_message(
+    m: BaseAgentEvent | BaseChatMessage, agent_name: str, is_multimodal: bool
+) -> LLMMessage | None:
+    source = m.source
+    # Models without vision get list content flattened to text right away, with
+    # images replaced by placeholders the same way remove_images would do it
+    if source == agent_name:
+        assert isinstance(m, TextMessage), f"{type(m)}"
+        return AssistantMessage(content=m.content, source=source)
+    elif source == "user_proxy" or source == "user":
+        assert isinstance(m, (TextMessage, MultiModalMessage)), f"{type(m)}"
+        if isinstance(m.content, str):
+            return UserMessage(content=_human_input_to_str(m.content), source=source)
+        elif not any(isinstance(item, str) for item in m.content):
+            # Nothing to transform, so the content can be passed through as is
+            return UserMessage(
+                content=m.content if is_multimodal else content_to_str(m.content),
+                source=source,
+            )
+        else:
+            # If content is a list, transform only the string parts
+            content = [
+                _human_input_to_str(item) if isinstance(item, str) else item
+                for item in m.content
+            ]
+            return UserMessage(
+                content=content if is_multimodal else content_to_str(content),
+                source=source,
+            )
+    else:
+        assert isinstance(m, BaseTextChatMessage) or isinstance(
+            m, MultiModalMessage
+        ), f"{type(m)}"
+        if isinstance(m.content, str):
+            return UserMessage(content=m.content, source=source)
+        return UserMessage(
+            content=m.content if is_multimodal else content_to_str(m.content),
+            source=source,
+        )
+
+
+_MessageHandler = Callable[
+    [BaseAgentEvent | BaseChatMessage, str, bool], Optional[LLMMessage]
+]
+
+# Handlers for thread_to_context keyed by the exact message type. Subclasses are
+# resolved with isinstance on first sight and then cached here.
+_MESSAGE_HANDLERS: Dict[type, _MessageHandler] = {
+    ToolCallRequestEvent: _skip_message,
+    ToolCallExecutionEvent: _skip_message,
+    StopMessage: _stop_or_handoff_to_message,
+    HandoffMessage: _stop_or_handoff_to_message,
+}
+
+
+def _get_message_handler(message_type: type) -> _MessageHandler:
+    handler = _MESSAGE_HANDLERS.get(message_type)
+    if handler is None:
+        if issubclass(message_type, (ToolCallRequestEvent, ToolCallExecutionEvent)):
+            handler = _skip_message
+        elif issubclass(message_type, (StopMessage, HandoffMessage)):
+            handler = _stop_or_handoff_to_message
+        else:
+            handler = _chat_message_to_message
+        _MESSAGE_HANDLERS[message_type] = handler
+    return handler
+
+
 def thread_to_context(
     messages: List[BaseAgentEvent | BaseChatMessage],
     agent_name: str,
@@ -127,55 +234,28 @@ def thread_to_context(
     """Convert the message thread to a context for the model."""
     context: List[LLMMessage] = []
     for m in messages:
-        if isinstance(m, ToolCallRequestEvent | ToolCallExecutionEvent):
-            # Ignore tool call messages.
-            continue
-        elif isinstance(m, StopMessage | HandoffMessage):
-            context.append(UserMessage(content=m.content, source=m.source))
-        elif m.source == agent_name:
-            assert isinstance(m, TextMessage), f"{type(m)}"
-            context.append(AssistantMessage(content=m.content, source=m.source))
-        elif m.source == "user_proxy" or m.source == "user":
-            assert isinstance(m, TextMessage | MultiModalMessage), f"{type(m)}"
-            if isinstance(m.content, str):
-                human_input = HumanInputFormat.from_str(m.content)
-                content = f"{human_input.content}"
-                if human_input.plan is not None:
-                    content += f"\n\nI created the following plan: {human_input.plan}"
-                context.append(UserMessage(content=content, source=m.source))
-            else:
-                # If content is a list, transform only the string part
-                content_list = list(m.content)  # Create a copy of the list
-                for i, item in enumerate(content_list):
-                    if isinstance(item, str):
-                        human_input = HumanInputFormat.from_str(item)
-                        content_list[i] = f"{human_input.content}"
-                        if human_input.plan is not None and isinstance(
-                            content_list[i], str
-                        ):
-                            content_list[i] = (
-                                f"{content_list[i]}\n\nI created the following plan: {human_input.plan}"
-                            )
-                context.append(UserMessage(content=content_list, source=m.source))  # type: ignore
-        else:
-            assert isinstance(m, BaseTextChatMessage) or isinstance(
-                m, MultiModalMessage
-            ), f"{type(m)}"
-            context.append(UserMessage(content=m.content, source=m.source))
-    if is_multimodal:
-        return context
-    else:
-        return remove_images(context)
+        message = _get_message_handler(type(m))(m, agent_name, is_multimodal)
+        if message is not None:
+            context.append(message)
+    return context
 
 
-def get_internal_urls(inside_docker: bool, paths: RunPaths) -> List[str] | None:
-    if not inside_docker:
-        return None
-    urls: List[str] = []
-    for _, addrs in psutil.net_if_addrs().items():
-        for addr in addrs:
-            if addr.family.name == "AF_INET":
-                urls.append(addr.address)
+@functools.lru_cache(maxsize=1)
+def _get_container_urls() -> Tuple[str, ...]:
+    """
+    Collect the IPv4 addresses and names this container is reachable under.
+    Interfaces and container environment variables don't change during a container's
+    lifetime, so this is only computed once.
+    """
+    # Imported here since it is only needed when running inside docker
+    import psutil
+
+    urls: List[str] = [
+        addr.address
+        for addrs in psutil.net_if_addrs().values()
+        for addr in addrs
+        if addr.family == socket.AF_INET
+    ]
 
     hostname = os.getenv("HOSTNAME")
     if hostname is not None:
@@ -183,4 +263,10 @@ def get_internal_urls(inside_docker: bool, paths: RunPaths) -> List[str] | None:
     container_name = os.getenv("CONTAINER_NAME")
     if container_name is not None:
         urls.append(container_name)
-    return urls
+    return tuple(urls)
+
+
+def get_internal_urls(inside_docker: bool, paths: RunPaths) -> List[str] | None:
+    if not inside_docker:
+        return None
+    return list(_get_container_urls())
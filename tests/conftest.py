@@ -0,0 +1,18 @@
+import pytest_asyncio
+from typing import AsyncGenerator
+from playwright.async_api import Browser, Playwright, async_playwright
+
+
+@pytest_asyncio.fixture(scope="session")
+async def playwright() -> AsyncGenerator[Playwright, None]:
+    """Fixture that provides the Playwright driver for the whole session."""
+    async with async_playwright() as pw:
+        yield pw
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser(playwright: Playwright) -> AsyncGenerator[Browser, None]:
+    """Fixture that provides one headless browser shared by all test modules."""
+    browser = await playwright.chromium.launch(headless=True)
+    yield browser
+    await browser.close()
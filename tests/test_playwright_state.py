@@ -1,7 +1,10 @@
+import asyncio
+import json
 import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
-from playwright.async_api import Browser, BrowserContext, async_playwright
+from aiohttp import web
+from playwright.async_api import Browser, BrowserContext, Page
 from magentic_ui.tools.playwright.playwright_state import (
     BrowserState,
     Tab,
@@ -10,43 +13,69 @@ from magentic_ui.tools.playwright.playwright_state import (
 )
 
 
-@pytest_asyncio.fixture
-async def browser() -> AsyncGenerator[Browser, None]:
-    """Fixture that provides a browser instance."""
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=True)
-        yield browser
-        await browser.close()
-
-
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module")
 async def browser_context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
-    """Fixture that provides a browser context."""
+    """Fixture that provides a browser context shared by the tests in this module."""
     context = await browser.new_context()
     yield context
     await context.close()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def reset_browser_context(browser_context: BrowserContext) -> None:
+    """Fixture that clears pages, cookies and permissions left over from earlier tests."""
+    await asyncio.gather(*(page.close() for page in browser_context.pages))
+    await browser_context.clear_cookies()
+    await browser_context.clear_permissions()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def local_server() -> AsyncGenerator[str, None]:
+    """Fixture that serves the tall test pages over HTTP and provides the base url."""
+
+    async def tall_page(request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        return web.Response(
+            text=f"<body style='height: 2000px'>{name}</body>",
+            content_type="text/html",
+        )
+
+    app = web.Application()
+    app.router.add_get("/{name}", tall_page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    yield f"http://{host}:{port}"
+    await runner.cleanup()
+
+
+@pytest.fixture(scope="session")
+def tall_page_url(local_server: str) -> str:
+    """Fixture that provides a stable url of a page tall enough to scroll."""
+    return f"{local_server}/tall"
+
+
 @pytest_asyncio.fixture
 async def multi_tab_context(
-    browser_context: BrowserContext,
+    browser_context: BrowserContext, local_server: str
 ) -> AsyncGenerator[BrowserContext, None]:
     # Create multiple tabs with different URLs and scroll positions
-    pages = []
-    urls = [
-        "data:text/html,<body style='height: 2000px'>Page 1</body>",
-        "data:text/html,<body style='height: 2000px'>Page 2</body>",
-        "data:text/html,<body style='height: 2000px'>Page 3</body>",
-    ]
+    urls = [f"{local_server}/p1", f"{local_server}/p2", f"{local_server}/p3"]
 
-    for url in urls:
+    async def open_tab(url: str) -> Page:
         page = await browser_context.new_page()
         await page.goto(url)
         await page.evaluate("window.scrollTo(0, 100)")
-        pages.append(page)
+        return page
+
+    # The tabs are independent, so each is opened, loaded and scrolled concurrently
+    await asyncio.gather(*(open_tab(url) for url in urls))
 
-    # Set the second tab as active
-    await pages[1].bring_to_front()
+    # Set the second tab as active. Tabs may have been created in any order, so
+    # this goes by the context's order, which is what the tests index into
+    await browser_context.pages[1].bring_to_front()
 
     yield browser_context
 
@@ -69,11 +98,12 @@ async def test_save_state_basic(browser_context: BrowserContext):
 
 
 @pytest.mark.asyncio
-async def test_save_state_with_scroll(browser_context: BrowserContext):
+async def test_save_state_with_scroll(
+    browser_context: BrowserContext, tall_page_url: str
+):
     """Test saving state with scroll position"""
     page = await browser_context.new_page()
-    url = "data:text/html,<body style='height: 2000px'>Test Page</body>"
-    await page.goto(url)
+    await page.goto(tall_page_url)
     await page.evaluate("window.scrollTo(0, 100)")
 
     state = await save_browser_state(browser_context, simplified=False)
@@ -93,6 +123,23 @@ async def test_save_state_multiple_tabs(multi_tab_context: BrowserContext):
     assert all(tab.scrollY == 100 for tab in state.tabs)
 
 
+@pytest.mark.asyncio
+async def test_save_state_to_path(browser_context: BrowserContext, tmp_path):
+    """Test saving storage state directly to a file"""
+    page = await browser_context.new_page()
+    await page.goto("data:text/html,<body>Test Page</body>")
+    storage_path = str(tmp_path / "storage_state.json")
+
+    state = await save_browser_state(
+        browser_context, simplified=False, storage_path=storage_path
+    )
+
+    assert state.state == {"path": storage_path}
+    with open(storage_path) as f:
+        assert "cookies" in json.load(f)
+    assert len(state.tabs) == 1
+
+
 @pytest.mark.asyncio
 async def test_load_state_basic(browser_context: BrowserContext):
     """Test loading a basic state"""
@@ -117,13 +164,15 @@ async def test_load_state_basic(browser_context: BrowserContext):
 
 
 @pytest.mark.asyncio
-async def test_load_state_with_scroll(browser_context: BrowserContext):
+async def test_load_state_with_scroll(
+    browser_context: BrowserContext, tall_page_url: str
+):
     """Test loading state with scroll position"""
     test_state = BrowserState(
         state={},
         tabs=[
             Tab(
-                url="data:text/html,<body style='height: 2000px'>Test Page</body>",
+                url=tall_page_url,
                 index=0,
                 scrollX=0,
                 scrollY=100,
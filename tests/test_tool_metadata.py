@@ -0,0 +1,59 @@
+import pytest
+
+from magentic_ui.tools.tool_metadata import (
+    ToolMetadata,
+    _ToolMetadataRegistry,
+    get_tool_metadata,
+    load_tool,
+)
+
+
+def test_tool_metadata_registry():
+    """Test registering and looking up tool metadata."""
+    registry = _ToolMetadataRegistry()
+    metadata: ToolMetadata = {"irreversible": "maybe"}
+
+    assert registry.get("tool") is None
+    assert registry.get(None) is None
+
+    before = registry.snapshot()
+    registry.register("tool", metadata)
+
+    # The old view is not mutated; a new one is published on register
+    assert "tool" not in before
+    assert registry.snapshot()["tool"] == metadata
+    assert registry.get("tool") == metadata
+
+    replacement: ToolMetadata = {"irreversible": "always"}
+    registry.register("tool", replacement)
+    assert registry.get("tool") == replacement
+
+    with pytest.raises(TypeError):
+        registry.snapshot()["other"] = metadata  # type: ignore
+
+
+def test_get_tool_metadata():
+    """Test load_tool registers metadata that get_tool_metadata can find."""
+    schema = load_tool(
+        {
+            "type": "function",
+            "function": {
+                "name": "test_tool_metadata_tool",
+                "description": "A test tool.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                    "required": [],
+                },
+            },
+            "metadata": {"requires_approval": "never"},
+        }
+    )
+
+    assert get_tool_metadata("test_tool_metadata_tool") == {
+        "requires_approval": "never"
+    }
+    assert get_tool_metadata(schema) == {"requires_approval": "never"}
+
+    with pytest.raises(ValueError):
+        get_tool_metadata("unknown_tool")
@@ -0,0 +1,153 @@
+import dataclasses
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from magentic_ui.types import (
+    CheckpointEvent,
+    HumanInputFormat,
+    Plan,
+    PlanStep,
+    RunPaths,
+)
+
+
+def test_human_input_from_str():
+    """Test parsing HumanInputFormat from JSON and plain strings."""
+    input_str = json.dumps(
+        {
+            "content": "Find a recipe",
+            "accepted": True,
+            "plan": [
+                {"title": "Search", "details": "Search the web", "agent_name": "web"}
+            ],
+        }
+    )
+    human_input = HumanInputFormat.from_str(input_str)
+
+    assert human_input.content == "Find a recipe"
+    assert human_input.accepted is True
+    assert human_input.plan is not None
+    assert human_input.plan[0].title == "Search"
+
+    plain_input = HumanInputFormat.from_str("Just a sentence")
+    assert plain_input.content == "Just a sentence"
+    assert plain_input.accepted is False
+    assert plain_input.plan is None
+
+    # Only JSON objects are parsed, other JSON values are treated as plain content
+    list_input = HumanInputFormat.from_str("[1, 2]")
+    assert list_input.content == "[1, 2]"
+    assert list_input.plan is None
+    assert HumanInputFormat.from_str("  " + input_str).content == "Find a recipe"
+
+
+def test_human_input_from_str_is_cached():
+    """Test that repeated parses of the same string return the cached instance."""
+    input_str = json.dumps(
+        {
+            "content": "cached",
+            "accepted": True,
+            "plan": [{"title": "Step", "details": "Details", "agent_name": "web"}],
+        }
+    )
+
+    assert HumanInputFormat.from_str(input_str) is HumanInputFormat.from_str(input_str)
+
+    # Cached instances are shared, so they must not be mutable, nested plans included
+    human_input = HumanInputFormat.from_str(input_str)
+    assert human_input.plan is not None
+    with pytest.raises(ValidationError):
+        human_input.content = "changed"
+    with pytest.raises(ValidationError):
+        human_input.plan.task = "changed"
+    with pytest.raises(ValidationError):
+        human_input.plan[0].title = "changed"
+
+
+def test_human_input_from_dict():
+    """Test loading HumanInputFormat from a dictionary with and without a plan."""
+    plan = Plan(
+        task="Task",
+        steps=[PlanStep(title="Step", details="Details", agent_name="agent")],
+    )
+    human_input = HumanInputFormat.from_dict(
+        {"content": "Hello", "accepted": True, "plan": plan}
+    )
+    assert human_input.plan is plan
+
+    human_input = HumanInputFormat.from_dict(
+        {"content": "Hello", "plan": plan.model_dump()}
+    )
+    assert human_input.plan == plan
+    assert human_input.accepted is False
+
+    assert HumanInputFormat.from_dict({"content": "Hello"}).plan is None
+
+    # Raw plans may also be a list of steps or a JSON string
+    steps = [step.model_dump() for step in plan.steps]
+    assert HumanInputFormat.from_dict({"content": "Hello", "plan": steps}).plan == Plan(
+        task=None, steps=plan.steps
+    )
+    assert (
+        HumanInputFormat.from_dict(
+            {"content": "Hello", "plan": json.dumps(plan.model_dump())}
+        ).plan
+        == plan
+    )
+    assert HumanInputFormat.from_str(human_input.to_str()) == human_input
+
+
+def test_run_paths_is_frozen(tmp_path):
+    """Test that RunPaths can't be modified and can be used as a cache key."""
+    paths = RunPaths(
+        internal_root_dir=tmp_path,
+        external_root_dir=tmp_path,
+        run_suffix="test",
+        internal_run_dir=tmp_path / "test",
+        external_run_dir=tmp_path / "test",
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        paths.run_suffix = "other"  # type: ignore
+    assert {paths: 1}[dataclasses.replace(paths)] == 1
+
+
+def test_checkpoint_event_metadata():
+    """Test that checkpoint events share their default metadata and serialize it."""
+    first = CheckpointEvent(state="{}", source="orchestrator")
+    second = CheckpointEvent(state="{}", source="orchestrator")
+
+    assert first.metadata is second.metadata
+    assert json.loads(first.model_dump_json())["metadata"] == {"internal": "yes"}
+    assert CheckpointEvent(
+        state="{}", source="orchestrator", metadata={"internal": "no"}
+    ).metadata == {"internal": "no"}
+
+
+def test_human_input_to_str():
+    """Test that to_str serializes the same fields as model_dump."""
+    plan = Plan(
+        task="Task",
+        steps=[PlanStep(title="Step", details="Details", agent_name="agent")],
+    )
+    for human_input in (
+        HumanInputFormat(content="Hello", accepted=True, plan=plan),
+        HumanInputFormat(content="Hello"),
+    ):
+        assert json.loads(human_input.to_str()) == human_input.model_dump()
+
+
+def test_plan_str():
+    """Test the string representation of a plan."""
+    plan = Plan(
+        task="Task",
+        steps=[
+            PlanStep(title="First", details="Do this", agent_name="web"),
+            PlanStep(title="Second", details="Do that", agent_name="coder"),
+        ],
+    )
+    assert str(plan) == (
+        "Task: Task\n0. web: First\n   Do this\n1. coder: Second\n   Do that\n"
+    )
+    assert str(Plan(task=None, steps=[])) == ""
@@ -3,6 +3,7 @@ from typing import Dict
 
 from magentic_ui.tools.url_status_manager import (
     URL_ALLOWED,
+    URL_REJECTED,
     UrlStatusManager,
     UrlStatus,
 )
@@ -46,3 +47,62 @@ async def test_url_status_manager():
     assert not url_status_manager.is_url_allowed("sample.com")
     assert not url_status_manager.is_url_allowed("sample.com/foo")
     assert not url_status_manager.is_url_allowed("sample.com/bar")
+
+
+@pytest.mark.asyncio
+async def test_url_status_manager_rejected_and_blocked():
+    """Test rejected and blocked urls, including overlapping patterns."""
+
+    url_statuses: Dict[str, UrlStatus] = {
+        "example.com": URL_ALLOWED,
+        "example.com/private": URL_REJECTED,
+        "rejected.com": URL_REJECTED,
+    }
+
+    url_status_manager = UrlStatusManager(
+        url_statuses=url_statuses, url_block_list=["blocked.com"]
+    )
+
+    # A url matching both an allowed and a rejected pattern is both allowed and rejected
+    assert url_status_manager.is_url_allowed("example.com/private/x")
+    assert url_status_manager.is_url_rejected("example.com/private/x")
+
+    assert url_status_manager.is_url_allowed("example.com/public")
+    assert not url_status_manager.is_url_rejected("example.com/public")
+
+    assert url_status_manager.is_url_rejected("https://rejected.com")
+    assert not url_status_manager.is_url_allowed("https://rejected.com")
+
+    assert not url_status_manager.is_url_rejected("unknown.com")
+    assert not url_status_manager.is_url_allowed("unknown.com")
+
+    assert url_status_manager.is_url_blocked("https://www.blocked.com/page")
+    assert url_status_manager.is_url_rejected("https://www.blocked.com/page")
+    assert not url_status_manager.is_url_allowed("https://www.blocked.com/page")
+    assert not url_status_manager.is_url_blocked("example.com")
+
+    unrestricted_manager = UrlStatusManager(url_block_list=["blocked.com"])
+    assert unrestricted_manager.is_url_allowed("anything.com")
+    assert not unrestricted_manager.is_url_rejected("anything.com")
+    assert not unrestricted_manager.is_url_allowed("blocked.com")
+
+
+@pytest.mark.asyncio
+async def test_url_status_manager_set_url_status():
+    """Test that statuses set after construction are matched and can be changed."""
+
+    url_status_manager = UrlStatusManager(url_statuses={"example.com": URL_ALLOWED})
+
+    assert not url_status_manager.is_url_allowed("https://www.other.com/page")
+    url_status_manager.set_url_status("other.com/", URL_ALLOWED)
+    assert url_status_manager.is_url_allowed("https://www.other.com/page")
+
+    url_status_manager.set_url_status("example.com", URL_REJECTED)
+    assert not url_status_manager.is_url_allowed("example.com")
+    assert url_status_manager.is_url_rejected("example.com")
+    assert url_status_manager.get_rejected_sites() == ["example.com"]
+
+    # Without a status list every url is allowed and setting a status is a no-op
+    unrestricted_manager = UrlStatusManager()
+    unrestricted_manager.set_url_status("example.com", URL_REJECTED)
+    assert not unrestricted_manager.is_url_rejected("example.com")
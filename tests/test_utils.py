@@ -0,0 +1,123 @@
+import json
+from typing import List
+
+import PIL.Image
+import pytest
+from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    MultiModalMessage,
+    StopMessage,
+    TextMessage,
+    ToolCallRequestEvent,
+)
+from autogen_core import FunctionCall, Image
+from autogen_core.models import AssistantMessage, UserMessage
+
+from magentic_ui.types import RunPaths
+from magentic_ui.utils import (
+    get_internal_urls,
+    json_data_to_markdown,
+    thread_to_context,
+)
+
+
+def test_json_data_to_markdown():
+    """Test converting nested dicts, lists and JSON strings to markdown."""
+    data = {
+        "name": "x",
+        "tags": ["a", {"k": 1, "l": [True, None]}, ["n1", "n2"]],
+        "nested": {"deep": {"v": 1.5}, "empty": []},
+    }
+    assert json_data_to_markdown(data) == (
+        "- name: x\n"
+        "- tags: \n"
+        "  - a\n"
+        "  - \n"
+        "    - k: 1\n"
+        "    - l: \n"
+        "      - True\n"
+        "      - None\n"
+        "  - \n"
+        "    - n1\n"
+        "    - n2\n"
+        "- nested: \n"
+        "  - deep: \n"
+        "    - v: 1.5\n"
+        "  - empty: \n"
+    )
+    assert json_data_to_markdown('[1, [2, 3], {"a": {}}]') == (
+        "- 1\n- \n  - 2\n  - 3\n- \n  - a: \n"
+    )
+
+    with pytest.raises(ValueError):
+        json_data_to_markdown('"just a string"')
+
+
+def test_get_internal_urls(tmp_path):
+    """Test that internal urls are only collected inside docker."""
+    paths = RunPaths(
+        internal_root_dir=tmp_path,
+        external_root_dir=tmp_path,
+        run_suffix="test",
+        internal_run_dir=tmp_path,
+        external_run_dir=tmp_path,
+    )
+    assert get_internal_urls(False, paths) is None
+
+    urls = get_internal_urls(True, paths)
+    assert urls is not None
+    assert "127.0.0.1" in urls
+    # Each call returns its own list, so callers can't corrupt the cached result
+    urls.append("example.com")
+    assert "example.com" not in get_internal_urls(True, paths)
+
+
+def _make_thread() -> List[BaseAgentEvent | BaseChatMessage]:
+    image = Image.from_pil(PIL.Image.new("RGB", (1, 1)))
+    plan_input = json.dumps(
+        {
+            "content": "Do the task",
+            "plan": [{"title": "Step", "details": "Details", "agent_name": "web"}],
+        }
+    )
+    return [
+        TextMessage(content=plan_input, source="user"),
+        ToolCallRequestEvent(
+            content=[FunctionCall(id="1", name="tool", arguments="{}")],
+            source="assistant",
+        ),
+        TextMessage(content="I will do it", source="assistant"),
+        MultiModalMessage(content=["Look at this", image], source="user_proxy"),
+        MultiModalMessage(content=[image, "A screenshot"], source="web_surfer"),
+        StopMessage(content="Done", source="web_surfer"),
+    ]
+
+
+def test_thread_to_context():
+    """Test converting a message thread to model context."""
+    messages = _make_thread()
+    context = thread_to_context(messages, agent_name="assistant", is_multimodal=True)
+
+    assert [type(m) for m in context] == [
+        UserMessage,
+        AssistantMessage,
+        UserMessage,
+        UserMessage,
+        UserMessage,
+    ]
+    assert context[0].content == (
+        "Do the task\n\nI created the following plan: 0. web: Step\n   Details\n"
+    )
+    assert context[1].content == "I will do it"
+    assert context[2].content[0] == "Look at this"
+    assert isinstance(context[2].content[1], Image)
+    assert isinstance(context[3].content[0], Image)
+    assert context[4].content == "Done"
+
+    text_context = thread_to_context(
+        messages, agent_name="assistant", is_multimodal=False
+    )
+    assert text_context[2].content == "Look at this\n<image>"
+    assert text_context[3].content == "<image>\nA screenshot"
+    assert text_context[4].content == "Done"